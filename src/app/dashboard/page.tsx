@@ -8,16 +8,7 @@ import {
   ClientUIActionResponse,
 } from '@/generated/protos/interaction';
 import LiveKitSession, { LiveKitRpcAdapter } from '@/components/LiveKitSession';
-
-// Helper function for Base64 encoding
-function uint8ArrayToBase64(buffer: Uint8Array): string {
-  let binary = "";
-  const len = buffer.byteLength;
-  for (let i = 0; i < len; i++) {
-    binary += String.fromCharCode(buffer[i]);
-  }
-  return btoa(binary);
-}
+import { uint8ArrayToBase64 } from '@/lib/utils';
 
 export default function DashRoxPage() {
   const liveKitRpcAdapterRef = useRef<LiveKitRpcAdapter | null>(null);
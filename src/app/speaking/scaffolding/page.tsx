@@ -16,16 +16,7 @@ import LiveKitSession, {
 } from "@/components/LiveKitSession";
 import InlineTimerButton from "@/components/ui/InlineTimerButton";
 import { RecordingBar } from "@/components/ui/record";
-
-// Helper function for Base64 encoding
-function uint8ArrayToBase64(buffer: Uint8Array): string {
-  let binary = "";
-  const len = buffer.byteLength;
-  for (let i = 0; i < len; i++) {
-    binary += String.fromCharCode(buffer[i]);
-  }
-  return btoa(binary);
-}
+import { uint8ArrayToBase64 } from "@/lib/utils";
 
 export default function Page(): JSX.Element {
   const liveKitRpcAdapterRef = useRef<LiveKitRpcAdapter | null>(null);
@@ -21,26 +21,7 @@ import {
    // Import for the new payload type
 } from '@/generated/protos/interaction'; // Adjust path if your generated file is elsewhere
 import { FrontendButtonClickRequest } from '@/generated/protos/interaction'; // Import request message
-
-// Helper functions for Base64 encoding/decoding Uint8Array <-> string
-function uint8ArrayToBase64(buffer: Uint8Array): string {
-  let binary = '';
-  const len = buffer.byteLength;
-  for (let i = 0; i < len; i++) {
-    binary += String.fromCharCode(buffer[i]);
-  }
-  return btoa(binary);
-}
-
-function base64ToUint8Array(base64: string): Uint8Array {
-  const binary_string = atob(base64);
-  const len = binary_string.length;
-  const bytes = new Uint8Array(len);
-  for (let i = 0; i < len; i++) {
-    bytes[i] = binary_string.charCodeAt(i);
-  }
-  return bytes;
-}
+import { uint8ArrayToBase64, base64ToUint8Array } from '@/lib/utils';
 
 // Interface that ts-proto generated clients expect
 // (Matches the Rpc interface in the generated interaction.ts)
@@ -49,6 +30,9 @@ interface Rpc {
 }
 
 export class LiveKitRpcAdapter implements Rpc {
+  // Per-call request/response logging; on in development builds by default.
+  public logRequests: boolean = process.env.NODE_ENV === 'development';
+
   constructor(
     private localParticipant: LocalParticipant,
     private agentIdentity: string,
@@ -64,7 +48,9 @@ export class LiveKitRpcAdapter implements Rpc {
     const payloadString = uint8ArrayToBase64(data);
 
     try {
-      console.log(`RPC Request: To=${this.agentIdentity}, Method=${fullMethodName}, Payload (base64)=${payloadString.substring(0,100)}...`);
+      if (this.logRequests) {
+        console.log(`RPC Request: To=${this.agentIdentity}, Method=${fullMethodName}, Payload (base64)=${payloadString.substring(0,100)}...`);
+      }
       const responseString = await this.localParticipant.performRpc({
         destinationIdentity: this.agentIdentity,
         method: fullMethodName,
@@ -72,7 +58,9 @@ export class LiveKitRpcAdapter implements Rpc {
         // Note: The 'timeout' parameter is not directly part of PerformRpcParams in the current SDK version.
         // The call will use LiveKit's default timeout (10 seconds).
       });
-      console.log(`RPC Response: From=${this.agentIdentity}, Method=${fullMethodName}, Response (base64)=${responseString.substring(0,100)}...`);
+      if (this.logRequests) {
+        console.log(`RPC Response: From=${this.agentIdentity}, Method=${fullMethodName}, Response (base64)=${responseString.substring(0,100)}...`);
+      }
       return base64ToUint8Array(responseString);
     } catch (error) {
       console.error(`RPC request to ${fullMethodName} for ${this.agentIdentity} failed:`, error);
@@ -122,6 +110,7 @@ interface LiveKitSessionProps {
   onRoomCreated?: (room: Room) => void;
   onConnected?: (room: Room, rpcAdapter: LiveKitRpcAdapter) => void;
   onPerformUIAction?: (data: RpcInvocationData) => Promise<string>;
+  logRpc?: boolean; // Overrides the adapter's default (development-only) RPC logging
 }
 
 export default function LiveKitSession({
@@ -145,12 +134,16 @@ export default function LiveKitSession({
   onRoomCreated,
   onConnected,
   onPerformUIAction,
+  logRpc,
 }: LiveKitSessionProps) {
   console.log('[LiveKitSession] Component rendering. Props received:', { roomName, userName });
   // State for UI elements that might be controlled by React state
   const [agentUpdatableTextState, setAgentUpdatableTextState] = useState("Initial text here. Agent can change me!");
   const [isAgentElementVisible, setIsAgentElementVisible] = useState(true);
   const liveKitRpcAdapterRef = useRef<LiveKitRpcAdapter | null>(null);
+  // Latest logRpc value, read when the adapter is created without re-running the room-event effect.
+  const logRpcRef = useRef(logRpc);
+  logRpcRef.current = logRpc;
 
   const [token, setToken] = useState('');
   const [audioInitialized, setAudioInitialized] = useState<boolean>(false);
@@ -357,6 +350,9 @@ export default function LiveKitSession({
             roomInstance.localParticipant,
             agentParticipant.identity // Use the DISCOVERED identity
         );
+        if (logRpcRef.current !== undefined) {
+          adapter.logRequests = logRpcRef.current;
+        }
         liveKitRpcAdapterRef.current = adapter;
 
         // Now that the adapter is correctly configured, notify the parent component.
@@ -421,7 +417,14 @@ export default function LiveKitSession({
       roomInstance.off(RoomEvent.Disconnected, handleDisconnected);
       roomInstance.off(RoomEvent.ParticipantConnected, onParticipantConnected);
     };
-  }, [onConnected, hideAudio]); // Simplified dependency array
+  }, [onConnected, hideAudio]); // logRpc is deliberately omitted; it is synced by the effect below
+
+  // Apply logRpc changes to an adapter that already exists.
+  useEffect(() => {
+    if (liveKitRpcAdapterRef.current && logRpc !== undefined) {
+      liveKitRpcAdapterRef.current.logRequests = logRpc;
+    }
+  }, [logRpc]);
 
 
     useEffect(() => {
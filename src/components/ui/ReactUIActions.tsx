@@ -8,6 +8,7 @@ import {
   AgentToClientUIActionRequest,
   ClientUIActionResponse
 } from '@/generated/protos/interaction';
+import { uint8ArrayToBase64, base64ToUint8Array } from '@/lib/utils';
 
 // First, let's extend the existing ClientUIActionType enum from your protos
 export enum ReactUIActionType {
@@ -59,26 +60,6 @@ export enum ReactUIActionType {
   SHOW_TOOLTIP_OR_COMMENT = 32
 }
 
-// Helper functions for Base64 encoding/decoding
-function uint8ArrayToBase64(buffer: Uint8Array): string {
-  let binary = '';
-  const len = buffer.byteLength;
-  for (let i = 0; i < len; i++) {
-    binary += String.fromCharCode(buffer[i]);
-  }
-  return btoa(binary);
-}
-
-function base64ToUint8Array(base64: string): Uint8Array {
-  const binary_string = atob(base64);
-  const len = binary_string.length;
-  const bytes = new Uint8Array(len);
-  for (let i = 0; i < len; i++) {
-    bytes[i] = binary_string.charCodeAt(i);
-  }
-  return bytes;
-}
-
 // Define our request and response interfaces
 export interface ReactUIActionRequest {
   requestId: string;
@@ -4,3 +4,28 @@ import { twMerge } from "tailwind-merge";
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
 }
+
+// Chunk size for uint8ArrayToBase64; keeps each String.fromCharCode spread
+// below the engine's argument limit.
+const BASE64_CHUNK_SIZE = 0x8000;
+
+// Helper functions for Base64 encoding/decoding Uint8Array <-> string,
+// used for LiveKit RPC payloads.
+export function uint8ArrayToBase64(buffer: Uint8Array): string {
+  let binary = "";
+  const len = buffer.byteLength;
+  for (let i = 0; i < len; i += BASE64_CHUNK_SIZE) {
+    binary += String.fromCharCode(...buffer.subarray(i, i + BASE64_CHUNK_SIZE));
+  }
+  return btoa(binary);
+}
+
+export function base64ToUint8Array(base64: string): Uint8Array {
+  const binary_string = atob(base64);
+  const len = binary_string.length;
+  const bytes = new Uint8Array(len);
+  for (let i = 0; i < len; i++) {
+    bytes[i] = binary_string.charCodeAt(i);
+  }
+  return bytes;
+}